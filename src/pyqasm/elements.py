@@ -39,7 +39,7 @@ class Context(Enum):
     GATE = "gate"
 
 
-@dataclass
+@dataclass(slots=True)
 class DepthNode:
     """Base class for depth nodes."""
 
@@ -48,7 +48,7 @@ class DepthNode:
     depth: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class QubitDepthNode(DepthNode):
     """Qubit depth node."""
 
@@ -64,7 +64,7 @@ class QubitDepthNode(DepthNode):
         return self._total_ops() == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ClbitDepthNode(DepthNode):
     """Classical bit depth node."""
 
@@ -74,7 +74,7 @@ class ClbitDepthNode(DepthNode):
         return self.num_measurements == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable:  # pylint: disable=too-many-instance-attributes
     """
     Class representing an OpenQASM variable.
@@ -12,22 +12,17 @@
 Module containing the class for evaluating QASM expressions.
 
 """
+from typing import Optional, Union
+
 from openqasm3.ast import (
     BinaryExpression,
     BooleanLiteral,
     BoolType,
-    DurationLiteral,
     Expression,
     FloatLiteral,
 )
 from openqasm3.ast import FloatType as Qasm3FloatType
-from openqasm3.ast import (
-    FunctionCall,
-    Identifier,
-    ImaginaryLiteral,
-    IndexExpression,
-    IntegerLiteral,
-)
+from openqasm3.ast import FunctionCall, Identifier, IndexExpression, IntegerLiteral
 from openqasm3.ast import IntType as Qasm3IntType
 from openqasm3.ast import SizeOf, Statement, UnaryExpression
 
@@ -53,23 +48,27 @@ class Qasm3ExprEvaluator:
         Args:
             var_name: The name of the variable to check.
             expression: The expression containing the variable.
+        Returns:
+            Variable: The variable visible in the current scope.
         Raises:
             ValidationError: If the variable is undefined in the current scope.
         """
 
-        if not cls.visitor_obj._check_in_scope(var_name):
+        var = cls.visitor_obj._get_from_visible_scope(var_name)
+        if var is None:
             raise_qasm3_error(
                 f"Undefined identifier {var_name} in expression",
                 ValidationError,
                 expression.span,
             )
+        return var
 
-    @classmethod
-    def _check_var_constant(cls, var_name, const_expr, expression):
+    @staticmethod
+    def _check_var_constant(var, const_expr, expression):
         """Checks if a variable is constant.
 
         Args:
-            var_name: The name of the variable to check.
+            var: The variable to check.
             const_expr: Whether the expression is a constant.
             expression: The expression containing the variable.
 
@@ -77,21 +76,20 @@ class Qasm3ExprEvaluator:
             ValidationError: If the variable is not a constant in the given
                                 expression.
         """
-        const_var = cls.visitor_obj._get_from_visible_scope(var_name).is_constant
-        if const_expr and not const_var:
+        if const_expr and not var.is_constant:
             raise_qasm3_error(
-                f"Variable '{var_name}' is not a constant in given expression",
+                f"Variable '{var.name}' is not a constant in given expression",
                 ValidationError,
                 expression.span,
             )
 
-    @classmethod
-    def _check_var_type(cls, var_name, reqd_type, expression):
+    @staticmethod
+    def _check_var_type(var, reqd_type, expression):
         """Check the type of a variable and raise an error if it does not match the
         required type.
 
         Args:
-            var_name: The name of the variable to check.
+            var: The variable to check.
             reqd_type: The required type of the variable.
             expression: The expression where the variable is used.
 
@@ -99,11 +97,9 @@ class Qasm3ExprEvaluator:
             ValidationError: If the variable has an invalid type for the required type.
         """
 
-        if not Qasm3Validator.validate_variable_type(
-            cls.visitor_obj._get_from_visible_scope(var_name), reqd_type
-        ):
+        if not Qasm3Validator.validate_variable_type(var, reqd_type):
             raise_qasm3_error(
-                f"Invalid type of variable {var_name} for required type {reqd_type}",
+                f"Invalid type of variable {var.name} for required type {reqd_type}",
                 ValidationError,
                 expression.span,
             )
@@ -128,28 +124,21 @@ class Qasm3ExprEvaluator:
             )
 
     @classmethod
-    def _get_var_value(cls, var_name, indices, expression):
+    def _get_var_value(cls, var, indices, expression):
         """Retrieves the value of a variable.
 
         Args:
-            var_name (str): The name of the variable.
+            var (Variable): The variable to read.
             indices (list): The indices of the variable (if it is an array).
             expression (Identifier or Expression): The expression representing the variable.
         Returns:
             var_value: The value of the variable.
         """
 
-        var_value = None
         if isinstance(expression, Identifier):
-            var_value = cls.visitor_obj._get_from_visible_scope(var_name).value
-        else:
-            validated_indices = Qasm3Analyzer.analyze_classical_indices(
-                indices, cls.visitor_obj._get_from_visible_scope(var_name), cls
-            )
-            var_value = Qasm3Analyzer.find_array_element(
-                cls.visitor_obj._get_from_visible_scope(var_name).value, validated_indices
-            )
-        return var_value
+            return var.value
+        validated_indices = Qasm3Analyzer.analyze_classical_indices(indices, var, cls)
+        return Qasm3Analyzer.find_array_element(var.value, validated_indices)
 
     @classmethod
     # pylint: disable-next=too-many-return-statements,too-many-branches,too-many-statements,too-many-locals
@@ -173,26 +162,36 @@ class Qasm3ExprEvaluator:
         if expression is None:
             return None, []
 
-        if isinstance(expression, (ImaginaryLiteral, DurationLiteral)):
-            raise_qasm3_error(
-                f"Unsupported expression type {type(expression)}",
-                ValidationError,
-                expression.span,
-            )
-
         def _check_and_return_value(value):
             if validate_only:
                 return None, statements
             return value, statements
 
         def _process_variable(var_name: str, indices=None):
-            cls._check_var_in_scope(var_name, expression)
-            cls._check_var_constant(var_name, const_expr, expression)
-            cls._check_var_type(var_name, reqd_type, expression)
-            var_value = cls._get_var_value(var_name, indices, expression)
+            var = cls._check_var_in_scope(var_name, expression)
+            cls._check_var_constant(var, const_expr, expression)
+            cls._check_var_type(var, reqd_type, expression)
+            var_value = cls._get_var_value(var, indices, expression)
             Qasm3ExprEvaluator._check_var_initialized(var_name, var_value, expression)
             return _check_and_return_value(var_value)
 
+        # literals are the most common leaves, check them first
+        if isinstance(expression, (BooleanLiteral, IntegerLiteral, FloatLiteral)):
+            if reqd_type:
+                if reqd_type == BoolType and isinstance(expression, BooleanLiteral):
+                    return _check_and_return_value(expression.value)
+                if reqd_type == Qasm3IntType and isinstance(expression, IntegerLiteral):
+                    return _check_and_return_value(expression.value)
+                if reqd_type == Qasm3FloatType and isinstance(expression, FloatLiteral):
+                    return _check_and_return_value(expression.value)
+                raise_qasm3_error(
+                    f"Invalid value {expression.value} with type {type(expression)} "
+                    f"for required type {reqd_type}",
+                    ValidationError,
+                    expression.span,
+                )
+            return _check_and_return_value(expression.value)
+
         if isinstance(expression, Identifier):
             var_name = expression.name
             if var_name in CONSTANTS_MAP:
@@ -215,10 +214,7 @@ class Qasm3ExprEvaluator:
 
             if isinstance(target, Identifier):
                 var_name = target.name
-                cls._check_var_in_scope(var_name, expression)
-                dimensions = cls.visitor_obj._get_from_visible_scope(  # type: ignore[union-attr]
-                    var_name
-                ).dims
+                dimensions = cls._check_var_in_scope(var_name, expression).dims
             else:
                 raise_qasm3_error(
                     message=f"Unsupported target type {type(target)} for sizeof expression",
@@ -249,22 +245,6 @@ class Qasm3ExprEvaluator:
                 )
             return _check_and_return_value(dimensions[index])
 
-        if isinstance(expression, (BooleanLiteral, IntegerLiteral, FloatLiteral)):
-            if reqd_type:
-                if reqd_type == BoolType and isinstance(expression, BooleanLiteral):
-                    return _check_and_return_value(expression.value)
-                if reqd_type == Qasm3IntType and isinstance(expression, IntegerLiteral):
-                    return _check_and_return_value(expression.value)
-                if reqd_type == Qasm3FloatType and isinstance(expression, FloatLiteral):
-                    return _check_and_return_value(expression.value)
-                raise_qasm3_error(
-                    f"Invalid value {expression.value} with type {type(expression)} "
-                    f"for required type {reqd_type}",
-                    ValidationError,
-                    expression.span,
-                )
-            return _check_and_return_value(expression.value)
-
         if isinstance(expression, UnaryExpression):
             operand, returned_stats = cls.evaluate_expression(
                 expression.expression, const_expr, reqd_type
@@ -303,6 +283,37 @@ class Qasm3ExprEvaluator:
             f"Unsupported expression type {type(expression)}", ValidationError, expression.span
         )
 
+    @classmethod
+    def fold_constant_expression(cls, expression) -> Optional[Union[int, float]]:
+        """Fold an expression built only from numeric literals and built-in constants,
+        eg. -pi/2 or 2*pi, without going through the full evaluator.
+
+        Args:
+            expression (Any): The expression to fold.
+
+        Returns:
+            Optional[Union[int, float]]: The folded value, or None if the expression can not
+                                         be folded and needs to be evaluated.
+        """
+        if isinstance(expression, (IntegerLiteral, FloatLiteral)):
+            return expression.value
+        if isinstance(expression, Identifier):
+            return CONSTANTS_MAP.get(expression.name)
+        if isinstance(expression, UnaryExpression) and expression.op.name == "-":
+            op_name, operands = "UMINUS", [expression.expression]
+        elif isinstance(expression, BinaryExpression):
+            op_name, operands = expression.op.name, [expression.lhs, expression.rhs]
+        else:
+            return None
+
+        operand_values = []
+        for operand in operands:
+            operand_value = cls.fold_constant_expression(operand)
+            if operand_value is None:
+                return None
+            operand_values.append(operand_value)
+        return qasm3_expression_op_map(op_name, *operand_values)
+
     @classmethod
     def classical_register_in_expr(cls, expr: Expression) -> bool:
         """
@@ -123,7 +123,7 @@ def orthogonal_bidiagonalize(
 
     dim = base_diag.shape[0]
     rank = dim
-    while rank > 0 and np.all(np.less_equal(np.abs(base_diag[rank - 1, rank - 1]), atol)):
+    while rank > 0 and abs(base_diag[rank - 1, rank - 1]) <= atol:
         rank -= 1
     base_diag = base_diag[:rank, :rank]
 
@@ -14,7 +14,9 @@ Module mapping supported QASM gates/operations to lower level gate operations.
 """
 
 from openqasm3.ast import (
+    BinaryOperator,
     ClassicalDeclaration,
+    GateModifierName,
     QuantumBarrier,
     QuantumGate,
     QuantumGateDefinition,
@@ -35,4 +37,9 @@ SWITCH_BLACKLIST_STMTS = {
 
 SUPPORTED_QASM_VERSIONS = {"3.0", "3", "2", "2.0"}
 
+CONTROL_MODIFIERS = {GateModifierName.ctrl, GateModifierName.negctrl}
+
+# comparison operators allowed in a branching condition on a classical register
+BRANCHING_COMPARISON_OPERATORS = {BinaryOperator[o] for o in ["==", ">=", "<=", ">", "<"]}
+
 QUANTUM_STATEMENTS = (QuantumGate, QuantumBarrier, QuantumReset, QuantumMeasurementStatement)
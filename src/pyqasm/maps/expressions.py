@@ -13,7 +13,7 @@ Module mapping supported QASM expressions to lower level gate operations.
 
 """
 
-from typing import Callable, Union
+from typing import Any, Callable, Union
 
 import numpy as np
 from openqasm3.ast import AngleType, BitType, BoolType, ComplexType, FloatType, IntType, UintType
@@ -72,7 +72,19 @@ def qasm3_expression_op_map(op_name: str, *args) -> Union[float, int, bool]:
         raise ValidationError(f"Unsupported / undeclared QASM operator: {op_name}") from exc
 
 
-# pylint: disable=inconsistent-return-statements
+# Cast operation for each type, called with the value and the base size of the variable
+VARIABLE_TYPE_CAST_OPERATION_MAP: dict[Any, Callable[[Any, int], Any]] = {
+    BoolType: lambda value, _: bool(value),
+    IntType: lambda value, _: int(value),
+    UintType: lambda value, base_size: int(value) % (1 << base_size),
+    FloatType: lambda value, _: float(value),
+    # not sure if we wanna hande array bit assignments too.
+    # For now, we only cater to single bit assignment.
+    BitType: lambda value, _: value != 0,
+    AngleType: lambda value, _: value,  # not sure
+}
+
+
 def qasm_variable_type_cast(openqasm_type, var_name, base_size, rhs_value):
     """Cast the variable type to the type to match, if possible.
 
@@ -95,26 +107,19 @@ def qasm_variable_type_cast(openqasm_type, var_name, base_size, rhs_value):
             f"of type {openqasm_type}"
         )
 
-    if openqasm_type == BoolType:
-        return bool(rhs_value)
-    if openqasm_type == IntType:
-        return int(rhs_value)
-    if openqasm_type == UintType:
-        return int(rhs_value) % (2**base_size)
-    if openqasm_type == FloatType:
-        return float(rhs_value)
-    # not sure if we wanna hande array bit assignments too.
-    # For now, we only cater to single bit assignment.
-    if openqasm_type == BitType:
-        return rhs_value != 0
-    if openqasm_type == AngleType:
-        return rhs_value  # not sure
+    return VARIABLE_TYPE_CAST_OPERATION_MAP[openqasm_type](rhs_value, base_size)
 
 
 # IEEE 754 Standard for floats
 # https://openqasm.com/language/types.html#floating-point-numbers
 LIMITS_MAP = {"float_32": 1.70141183 * (10**38), "float_64": 10**308}
 
+# (lower, upper) bounds for float variables, keyed by base size
+FLOAT_LIMITS_MAP = {
+    32: (-1.0 * LIMITS_MAP["float_32"], LIMITS_MAP["float_32"]),
+    64: (-1.0 * LIMITS_MAP["float_64"], LIMITS_MAP["float_64"]),
+}
+
 CONSTANTS_MAP = {
     "π": 3.141592653589793,
     "pi": 3.141592653589793,
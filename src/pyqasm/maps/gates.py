@@ -26,6 +26,8 @@ from pyqasm.exceptions import ValidationError
 from pyqasm.linalg import kak_decomposition_angles
 from pyqasm.maps.expressions import CONSTANTS_MAP
 
+PI = CONSTANTS_MAP["pi"]
+
 
 def u3_gate(
     theta: Union[int, float],
@@ -50,10 +52,10 @@ def u3_gate(
     """
     result: list[QuantumGate] = []
     result.extend(one_qubit_rotation_op("rz", lam, qubit_id))
-    result.extend(one_qubit_rotation_op("rx", CONSTANTS_MAP["pi"] / 2, qubit_id))
-    result.extend(one_qubit_rotation_op("rz", theta + CONSTANTS_MAP["pi"], qubit_id))
-    result.extend(one_qubit_rotation_op("rx", CONSTANTS_MAP["pi"] / 2, qubit_id))
-    result.extend(one_qubit_rotation_op("rz", phi + CONSTANTS_MAP["pi"], qubit_id))
+    result.extend(one_qubit_rotation_op("rx", PI / 2, qubit_id))
+    result.extend(one_qubit_rotation_op("rz", theta + PI, qubit_id))
+    result.extend(one_qubit_rotation_op("rx", PI / 2, qubit_id))
+    result.extend(one_qubit_rotation_op("rz", phi + PI, qubit_id))
     return result
     # global phase - e^(i*(phi+lambda)/2) is missing in the above implementation
 
@@ -69,10 +71,10 @@ def u3_inv_gate(
     the u3_gate function.
     """
     result: list[QuantumGate] = []
-    result.extend(one_qubit_rotation_op("rz", -1.0 * (phi + CONSTANTS_MAP["pi"]), qubits))
-    result.extend(one_qubit_rotation_op("rx", -1.0 * (CONSTANTS_MAP["pi"] / 2), qubits))
-    result.extend(one_qubit_rotation_op("rz", -1.0 * (theta + CONSTANTS_MAP["pi"]), qubits))
-    result.extend(one_qubit_rotation_op("rx", -1.0 * (CONSTANTS_MAP["pi"] / 2), qubits))
+    result.extend(one_qubit_rotation_op("rz", -1.0 * (phi + PI), qubits))
+    result.extend(one_qubit_rotation_op("rx", -1.0 * (PI / 2), qubits))
+    result.extend(one_qubit_rotation_op("rz", -1.0 * (theta + PI), qubits))
+    result.extend(one_qubit_rotation_op("rx", -1.0 * (PI / 2), qubits))
     result.extend(one_qubit_rotation_op("rz", -1.0 * lam, qubits))
     return result
 
@@ -82,7 +84,7 @@ def u2_gate(phi, lam, qubits) -> list[QuantumGate]:
     Implements the U2 gate using the following decomposition:
         https://docs.quantum.ibm.com/api/qiskit/qiskit.circuit.library.U2Gate
     """
-    return u3_gate(CONSTANTS_MAP["pi"] / 2, phi, lam, qubits)
+    return u3_gate(PI / 2, phi, lam, qubits)
 
 
 def u2_inv_gate(phi, lam, qubits) -> list[QuantumGate]:
@@ -90,7 +92,7 @@ def u2_inv_gate(phi, lam, qubits) -> list[QuantumGate]:
     Implements the inverse of the U2 gate using the decomposition present in
     the u2_gate function.
     """
-    return u3_inv_gate(CONSTANTS_MAP["pi"] / 2, phi, lam, qubits)
+    return u3_inv_gate(PI / 2, phi, lam, qubits)
 
 
 def global_phase_gate(theta: float, qubit_list: list[IndexedIdentifier]) -> list[QuantumPhase]:
@@ -115,7 +117,7 @@ def sxdg_gate_op(qubit_id) -> list[QuantumGate]:
     """
     Implements the conjugate transpose of the Sqrt(X) gate as a decomposition of other gates.
     """
-    return one_qubit_rotation_op("rx", -CONSTANTS_MAP["pi"] / 2, qubit_id)
+    return one_qubit_rotation_op("rx", -PI / 2, qubit_id)
 
 
 def cy_gate(qubit0: IndexedIdentifier, qubit1: IndexedIdentifier) -> list[QuantumGate]:
@@ -169,7 +171,7 @@ def xy_gate(
     https://amazon-braket-sdk-python.readthedocs.io/en/latest/_apidoc/braket.circuits.gate.html#braket.circuits.gate.Gate.XY
 
     """
-    return xx_plus_yy_gate(theta, CONSTANTS_MAP["pi"], qubit0, qubit1)
+    return xx_plus_yy_gate(theta, PI, qubit0, qubit1)
 
 
 def xx_plus_yy_gate(
@@ -202,18 +204,18 @@ def xx_plus_yy_gate(
     result: list[QuantumGate] = []
 
     result.extend(one_qubit_rotation_op("rz", phi, qubit0))
-    result.extend(one_qubit_rotation_op("rz", -1 * (CONSTANTS_MAP["pi"] / 2), qubit1))
+    result.extend(one_qubit_rotation_op("rz", -1 * (PI / 2), qubit1))
     result.extend(one_qubit_gate_op("s", qubit0))
     result.extend(one_qubit_gate_op("sx", qubit1))
-    result.extend(one_qubit_rotation_op("rz", (CONSTANTS_MAP["pi"] / 2), qubit0))
+    result.extend(one_qubit_rotation_op("rz", (PI / 2), qubit0))
     result.extend(two_qubit_gate_op("cx", qubit1, qubit0))
     result.extend(one_qubit_rotation_op("ry", -1 * theta / 2, qubit0))
     result.extend(one_qubit_rotation_op("ry", -1 * theta / 2, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit1, qubit0))
-    result.extend(one_qubit_rotation_op("rz", (-1 * CONSTANTS_MAP["pi"] / 2), qubit0))
+    result.extend(one_qubit_rotation_op("rz", (-1 * PI / 2), qubit0))
     result.extend(one_qubit_gate_op("sxdg", qubit1))
     result.extend(one_qubit_gate_op("sdg", qubit0))
-    result.extend(one_qubit_rotation_op("rz", (CONSTANTS_MAP["pi"] / 2), qubit1))
+    result.extend(one_qubit_rotation_op("rz", (PI / 2), qubit1))
     result.extend(one_qubit_rotation_op("rz", -1 * phi, qubit0))
 
     return result
@@ -245,13 +247,13 @@ def ryy_gate(
 
     """
     result: list[QuantumGate] = []
-    result.extend(one_qubit_rotation_op("rx", CONSTANTS_MAP["pi"] / 2, qubit0))
-    result.extend(one_qubit_rotation_op("rx", CONSTANTS_MAP["pi"] / 2, qubit1))
+    result.extend(one_qubit_rotation_op("rx", PI / 2, qubit0))
+    result.extend(one_qubit_rotation_op("rx", PI / 2, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
     result.extend(one_qubit_rotation_op("rz", theta, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
-    result.extend(one_qubit_rotation_op("rx", -CONSTANTS_MAP["pi"] / 2, qubit0))
-    result.extend(one_qubit_rotation_op("rx", -CONSTANTS_MAP["pi"] / 2, qubit1))
+    result.extend(one_qubit_rotation_op("rx", -PI / 2, qubit0))
+    result.extend(one_qubit_rotation_op("rx", -PI / 2, qubit1))
     return result
 
 
@@ -365,11 +367,11 @@ def crx_gate(
              └────────────┘└───┘└─────────────────┘└───┘└───────────────────┘
     """
     result: list[QuantumGate] = []
-    result.extend(u3_gate(0, 0, CONSTANTS_MAP["pi"] / 2, qubit1))
+    result.extend(u3_gate(0, 0, PI / 2, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
     result.extend(u3_gate(-1 * theta / 2, 0, 0, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
-    result.extend(u3_gate(theta / 2, -1 * CONSTANTS_MAP["pi"] / 2, 0, qubit1))
+    result.extend(u3_gate(theta / 2, -1 * PI / 2, 0, qubit1))
     return result
 
 
@@ -584,13 +586,13 @@ def csx_gate(qubit0: IndexedIdentifier, qubit1: IndexedIdentifier) -> list[Quant
                  └─────────┘└───┘└──────────┘└───┘└─────────┘└─────────┘
     """
     result: list[QuantumGate] = []
-    result.extend(phaseshift_gate(CONSTANTS_MAP["pi"] / 4, qubit0))
-    result.extend(u2_gate(0, CONSTANTS_MAP["pi"], qubit1))
+    result.extend(phaseshift_gate(PI / 4, qubit0))
+    result.extend(u2_gate(0, PI, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
-    result.extend(phaseshift_gate(-CONSTANTS_MAP["pi"] / 4, qubit1))
+    result.extend(phaseshift_gate(-PI / 4, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
-    result.extend(phaseshift_gate(CONSTANTS_MAP["pi"] / 4, qubit1))
-    result.extend(u2_gate(0, CONSTANTS_MAP["pi"], qubit1))
+    result.extend(phaseshift_gate(PI / 4, qubit1))
+    result.extend(u2_gate(0, PI, qubit1))
 
     return result
 
@@ -619,15 +621,15 @@ def rccx_gate(
     qubit0: IndexedIdentifier, qubit1: IndexedIdentifier, qubit2: IndexedIdentifier
 ) -> list[QuantumGate]:
     result: list[QuantumGate] = []
-    result.extend(u2_gate(0, CONSTANTS_MAP["pi"], qubit2))
-    result.extend(phaseshift_gate(CONSTANTS_MAP["pi"] / 4, qubit2))
+    result.extend(u2_gate(0, PI, qubit2))
+    result.extend(phaseshift_gate(PI / 4, qubit2))
     result.extend(two_qubit_gate_op("cx", qubit1, qubit2))
-    result.extend(phaseshift_gate(-CONSTANTS_MAP["pi"] / 4, qubit2))
+    result.extend(phaseshift_gate(-PI / 4, qubit2))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit2))
-    result.extend(phaseshift_gate(CONSTANTS_MAP["pi"] / 4, qubit2))
+    result.extend(phaseshift_gate(PI / 4, qubit2))
     result.extend(two_qubit_gate_op("cx", qubit1, qubit2))
-    result.extend(phaseshift_gate(-CONSTANTS_MAP["pi"] / 4, qubit2))
-    result.extend(u2_gate(0, CONSTANTS_MAP["pi"], qubit2))
+    result.extend(phaseshift_gate(-PI / 4, qubit2))
+    result.extend(u2_gate(0, PI, qubit2))
 
     return result
 
@@ -758,9 +760,9 @@ def gpi_gate(phi, qubit_id) -> list[QuantumGate]:
     """
     Implements the gpi gate as a decomposition of other gates.
     """
-    theta_0 = CONSTANTS_MAP["pi"]
+    theta_0 = PI
     phi_0 = phi
-    lambda_0 = -phi_0 + CONSTANTS_MAP["pi"]
+    lambda_0 = -phi_0 + PI
     return u3_gate(theta_0, phi_0, lambda_0, qubit_id)
 
 
@@ -771,9 +773,9 @@ def gpi2_gate(phi, qubit_id) -> list[QuantumGate]:
     # Reference:
     # https://amazon-braket-sdk-python.readthedocs.io/en/latest/_apidoc/braket.circuits.circuit.html#braket.circuits.circuit.Circuit.gpi2
     # https://docs.quantum.ibm.com/api/qiskit/qiskit.circuit.library.U3Gate#u3gate
-    theta_0 = CONSTANTS_MAP["pi"] / 2
-    phi_0 = phi - CONSTANTS_MAP["pi"] / 2
-    lambda_0 = CONSTANTS_MAP["pi"] / 2 - phi
+    theta_0 = PI / 2
+    phi_0 = phi - PI / 2
+    lambda_0 = PI / 2 - phi
     return u3_gate(theta_0, phi_0, lambda_0, qubit_id)
 
 
@@ -818,10 +820,8 @@ def ms_gate(phi0, phi1, theta, qubit0, qubit1) -> list[QuantumGate]:
     result.extend(u3_gate(angles[1][0], angles[1][1], angles[1][2], qubits[1]))
     result.extend(one_qubit_gate_op("sx", qubits[0]))
     result.extend(two_qubit_gate_op("cx", qubits[0], qubits[1]))
-    result.extend(
-        one_qubit_rotation_op("rx", ((1 / 2) - 2 * theta) * CONSTANTS_MAP["pi"], qubits[0])
-    )
-    result.extend(one_qubit_rotation_op("rx", CONSTANTS_MAP["pi"] / 2, qubits[1]))
+    result.extend(one_qubit_rotation_op("rx", ((1 / 2) - 2 * theta) * PI, qubits[0]))
+    result.extend(one_qubit_rotation_op("rx", PI / 2, qubits[1]))
     result.extend(two_qubit_gate_op("cx", qubits[1], qubits[0]))
     result.extend(sxdg_gate_op(qubits[1]))
     result.extend(one_qubit_gate_op("s", qubits[1]))
@@ -850,7 +850,7 @@ def ecr_gate(qubit0: IndexedIdentifier, qubit1: IndexedIdentifier) -> list[Quant
     """
     result: list[QuantumGate] = []
     result.extend(one_qubit_gate_op("s", qubit0))
-    result.extend(one_qubit_rotation_op("rx", CONSTANTS_MAP["pi"] / 2, qubit1))
+    result.extend(one_qubit_rotation_op("rx", PI / 2, qubit1))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
     result.extend(one_qubit_gate_op("x", qubit0))
     return result
@@ -903,25 +903,25 @@ def c3sx_gate(
 
     result: list[QuantumGate] = []
     result.extend(one_qubit_gate_op("h", qubit3))
-    result.extend(cu1_gate(CONSTANTS_MAP["pi"] / 8, qubit0, qubit3))
+    result.extend(cu1_gate(PI / 8, qubit0, qubit3))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
     # h(q[3]) * h (q[3]) = Identity
-    result.extend(cu1_gate(-CONSTANTS_MAP["pi"] / 8, qubit1, qubit3))
+    result.extend(cu1_gate(-PI / 8, qubit1, qubit3))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit1))
     # h(q[3]) * h (q[3]) = Identity
-    result.extend(cu1_gate(CONSTANTS_MAP["pi"] / 8, qubit1, qubit3))
+    result.extend(cu1_gate(PI / 8, qubit1, qubit3))
     result.extend(two_qubit_gate_op("cx", qubit1, qubit2))
     # h(q[3]) * h (q[3]) = Identity
-    result.extend(cu1_gate(-CONSTANTS_MAP["pi"] / 8, qubit2, qubit3))
+    result.extend(cu1_gate(-PI / 8, qubit2, qubit3))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit2))
     # h(q[3]) * h (q[3]) = Identity
-    result.extend(cu1_gate(CONSTANTS_MAP["pi"] / 8, qubit2, qubit3))
+    result.extend(cu1_gate(PI / 8, qubit2, qubit3))
     result.extend(two_qubit_gate_op("cx", qubit1, qubit2))
     # h(q[3]) * h (q[3]) = Identity
-    result.extend(cu1_gate(-CONSTANTS_MAP["pi"] / 8, qubit2, qubit3))
+    result.extend(cu1_gate(-PI / 8, qubit2, qubit3))
     result.extend(two_qubit_gate_op("cx", qubit0, qubit2))
     # h(q[3]) * h (q[3]) = Identity
-    result.extend(cu1_gate(CONSTANTS_MAP["pi"] / 8, qubit2, qubit3))
+    result.extend(cu1_gate(PI / 8, qubit2, qubit3))
     result.extend(one_qubit_gate_op("h", qubit3))
 
     return result
@@ -954,8 +954,8 @@ def prx_gate(theta, phi, qubit_id) -> list[QuantumGate]:
     # https://amazon-braket-sdk-python.readthedocs.io/en/latest/_apidoc/braket.circuits.circuit.html#braket.circuits.circuit.Circuit.prx
     # https://docs.quantum.ibm.com/api/qiskit/qiskit.circuit.library.U3Gate#u3gate
     theta_0 = theta
-    phi_0 = phi - CONSTANTS_MAP["pi"] / 2
-    lambda_0 = CONSTANTS_MAP["pi"] / 2 - phi
+    phi_0 = phi - PI / 2
+    lambda_0 = PI / 2 - phi
     return u3_gate(theta_0, phi_0, lambda_0, qubit_id)
 
 
@@ -1135,6 +1135,29 @@ U_INV_ROTATION_MAP = {
     "u2": u2_inv_gate,
 }
 
+# Lookup table for the inverse of basic gates. Entries are listed from the
+# lowest to the highest priority, so later maps override earlier ones for
+# any gate name that appears in more than one of them.
+INV_OP_CALLABLE_MAP = {
+    **{
+        op_name: (ONE_QUBIT_ROTATION_MAP[op_name], 1, InversionOp.INVERT_ROTATION)
+        for op_name in ROTATION_INVERSION_ONE_QUBIT_OP_MAP
+    },
+    # Special handling for U gate as it is composed of multiple
+    # basic gates and we need to invert each of them
+    **{op_name: (func, 1, InversionOp.NO_OP) for op_name, func in U_INV_ROTATION_MAP.items()},
+    **{op_name: (func, 3, InversionOp.NO_OP) for op_name, func in THREE_QUBIT_OP_MAP.items()},
+    **{op_name: (func, 2, InversionOp.NO_OP) for op_name, func in TWO_QUBIT_OP_MAP.items()},
+    **{
+        op_name: (ONE_QUBIT_OP_MAP[inv_gate_name], 1, InversionOp.NO_OP)
+        for op_name, inv_gate_name in ST_GATE_INV_MAP.items()
+    },
+    **{
+        op_name: (ONE_QUBIT_OP_MAP[op_name], 1, InversionOp.NO_OP)
+        for op_name in SELF_INVERTING_ONE_QUBIT_OP_SET
+    },
+}
+
 
 def map_qasm_inv_op_to_callable(op_name: str):
     """
@@ -1147,23 +1170,7 @@ def map_qasm_inv_op_to_callable(op_name: str):
         tuple: A tuple containing the callable, the number of qubits the operation acts on,
         and what is to be done with the basic gate which we are trying to invert.
     """
-    if op_name in SELF_INVERTING_ONE_QUBIT_OP_SET:
-        return ONE_QUBIT_OP_MAP[op_name], 1, InversionOp.NO_OP
-    if op_name in ST_GATE_INV_MAP:
-        inv_gate_name = ST_GATE_INV_MAP[op_name]
-        return ONE_QUBIT_OP_MAP[inv_gate_name], 1, InversionOp.NO_OP
-    if op_name in TWO_QUBIT_OP_MAP:
-        return TWO_QUBIT_OP_MAP[op_name], 2, InversionOp.NO_OP
-    if op_name in THREE_QUBIT_OP_MAP:
-        return THREE_QUBIT_OP_MAP[op_name], 3, InversionOp.NO_OP
-    if op_name in U_INV_ROTATION_MAP:
-        # Special handling for U gate as it is composed of multiple
-        # basic gates and we need to invert each of them
-        return U_INV_ROTATION_MAP[op_name], 1, InversionOp.NO_OP
-    if op_name in ROTATION_INVERSION_ONE_QUBIT_OP_MAP:
-        return (
-            ONE_QUBIT_ROTATION_MAP[op_name],
-            1,
-            InversionOp.INVERT_ROTATION,
-        )
-    raise ValidationError(f"Unsupported / undeclared QASM operation: {op_name}")
+    try:
+        return INV_OP_CALLABLE_MAP[op_name]
+    except KeyError as err:
+        raise ValidationError(f"Unsupported / undeclared QASM operation: {op_name}") from err
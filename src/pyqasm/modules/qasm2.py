@@ -24,6 +24,10 @@ from pyqasm.exceptions import ValidationError
 from pyqasm.modules.base import QasmModule
 from pyqasm.modules.qasm3 import Qasm3Module
 
+# openqasm3 register declarations and their openqasm 2.0 keywords
+DECLARATION_PATTERN = re.compile(r"(qubit|bit)\[(\d+)\]\s+(\w+);")
+DECLARATION_KEYWORDS = {"qubit": "qreg", "bit": "creg"}
+
 
 class Qasm2Module(QasmModule):
     """
@@ -61,11 +65,10 @@ class Qasm2Module(QasmModule):
 
     def _format_declarations(self, qasm_str):
         """Format the unrolled qasm for declarations in openqasm 2.0 format"""
-        for declaration_type, replacement_type in [("qubit", "qreg"), ("bit", "creg")]:
-            pattern = rf"{declaration_type}\[(\d+)\]\s+(\w+);"
-            replacement = rf"{replacement_type} \2[\1];"
-            qasm_str = re.sub(pattern, replacement, qasm_str)
-        return qasm_str
+        # rewrite both qubit and bit declarations in a single pass over the string
+        return DECLARATION_PATTERN.sub(
+            lambda match: f"{DECLARATION_KEYWORDS[match[1]]} {match[3]}[{match[2]}];", qasm_str
+        )
 
     def _qasm_ast_to_str(self, qasm_ast):
         """Convert the qasm AST to a string"""
@@ -167,16 +167,19 @@ class Qasm3SubroutineProcessor:
         formal_arg_base_size = Qasm3ExprEvaluator.evaluate_expression(
             formal_arg.type.base_type.size
         )[0]
-        array_expected_type_msg = (
-            "Expecting type 'array["
-            f"{formal_arg.type.base_type.__class__.__name__.lower().removesuffix('type')}"
-            f"[{formal_arg_base_size}],...]' for '{formal_arg.name.name}'"
-            f" in function '{fn_name}'. "
-        )
+
+        def _array_expected_type_msg() -> str:
+            # only built when an error is raised
+            return (
+                "Expecting type 'array["
+                f"{formal_arg.type.base_type.__class__.__name__.lower().removesuffix('type')}"
+                f"[{formal_arg_base_size}],...]' for '{formal_arg.name.name}'"
+                f" in function '{fn_name}'. "
+            )
 
         if actual_arg_name is None:
             raise_qasm3_error(
-                array_expected_type_msg
+                _array_expected_type_msg()
                 + f"Literal {Qasm3ExprEvaluator.evaluate_expression(actual_arg)[0]} "
                 + "found in function call",
                 span=span,
@@ -184,26 +187,25 @@ class Qasm3SubroutineProcessor:
 
         if actual_arg_name in cls.visitor_obj._global_qreg_size_map:
             raise_qasm3_error(
-                array_expected_type_msg
+                _array_expected_type_msg()
                 + f"Qubit register '{actual_arg_name}' found for function call",
                 span=span,
             )
 
         # verify actual argument is defined in the parent scope of function call
-        if not cls.visitor_obj._check_in_scope(actual_arg_name):
+        array_reference = cls.visitor_obj._get_from_visible_scope(actual_arg_name)
+        if array_reference is None:
             raise_qasm3_error(
                 f"Undefined variable '{actual_arg_name}' used for function call '{fn_name}'",
                 span=span,
             )
 
-        array_reference = cls.visitor_obj._get_from_visible_scope(actual_arg_name)
-        actual_type_string = Qasm3Transformer.get_type_string(array_reference)
-
         # ensure that actual argument is an array
         if not array_reference.dims:
             raise_qasm3_error(
-                array_expected_type_msg
-                + f"Variable '{actual_arg_name}' has type '{actual_type_string}'.",
+                _array_expected_type_msg()
+                + f"Variable '{actual_arg_name}' has type "
+                + f"'{Qasm3Transformer.get_type_string(array_reference)}'.",
                 span=span,
             )
 
@@ -213,8 +215,9 @@ class Qasm3SubroutineProcessor:
 
         if formal_arg.type.base_type != actual_arg_type or formal_arg_base_size != actual_arg_size:
             raise_qasm3_error(
-                array_expected_type_msg
-                + f"Variable '{actual_arg_name}' has type '{actual_type_string}'.",
+                _array_expected_type_msg()
+                + f"Variable '{actual_arg_name}' has type "
+                + f"'{Qasm3Transformer.get_type_string(array_reference)}'.",
                 span=span,
             )
 
@@ -43,6 +43,7 @@ from openqasm3.ast import (
 from pyqasm.elements import Variable
 from pyqasm.exceptions import raise_qasm3_error
 from pyqasm.expressions import Qasm3ExprEvaluator
+from pyqasm.maps import BRANCHING_COMPARISON_OPERATORS
 from pyqasm.maps.expressions import VARIABLE_TYPE_MAP
 from pyqasm.validator import Qasm3Validator
 
@@ -267,7 +268,7 @@ class Qasm3Transformer:
                 False,
             )
         if isinstance(condition, BinaryExpression):
-            if condition.op not in [BinaryOperator[o] for o in ["==", ">=", "<=", ">", "<"]]:
+            if condition.op not in BRANCHING_COMPARISON_OPERATORS:
                 raise_qasm3_error(
                     message="Only {==, >=, <=, >, <} supported in branching condition "
                     "with classical register",
@@ -15,13 +15,13 @@ Module with utility functions for QASM visitor
 from typing import Any, Optional, Union
 
 import numpy as np
-from openqasm3.ast import ArrayType, ClassicalDeclaration, FloatType
+from openqasm3.ast import ArrayType, BitType, BoolType, ClassicalDeclaration, FloatType
 from openqasm3.ast import IntType as Qasm3IntType
 from openqasm3.ast import QuantumGate, QuantumGateDefinition, ReturnStatement, SubroutineDefinition
 
 from pyqasm.elements import Variable
 from pyqasm.exceptions import ValidationError, raise_qasm3_error
-from pyqasm.maps.expressions import LIMITS_MAP, VARIABLE_TYPE_MAP, qasm_variable_type_cast
+from pyqasm.maps.expressions import FLOAT_LIMITS_MAP, VARIABLE_TYPE_MAP, qasm_variable_type_cast
 
 
 class Qasm3Validator:
@@ -123,13 +123,10 @@ class Qasm3Validator:
         if type_to_match == int:
             base_size = variable.base_size
             if qasm_type == Qasm3IntType:
-                left, right = (
-                    -1 * (2 ** (base_size - 1)),
-                    2 ** (base_size - 1) - 1,
-                )
+                left, right = -(1 << (base_size - 1)), (1 << (base_size - 1)) - 1
             else:
                 # would be uint only so we correctly get this
-                left, right = 0, 2**base_size - 1
+                left, right = 0, (1 << base_size) - 1
             if type_casted_value < left or type_casted_value > right:
                 raise_qasm3_error(
                     f"Value {value} out of limits for variable {variable.name} with "
@@ -138,11 +135,7 @@ class Qasm3Validator:
 
         elif type_to_match == float:
             base_size = variable.base_size
-
-            if base_size == 32:
-                left, right = -1.0 * (LIMITS_MAP["float_32"]), (LIMITS_MAP["float_32"])
-            else:
-                left, right = -1.0 * (LIMITS_MAP["float_64"]), (LIMITS_MAP["float_64"])
+            left, right = FLOAT_LIMITS_MAP[32 if base_size == 32 else 64]
 
             if type_casted_value < left or type_casted_value > right:
                 raise_qasm3_error(
@@ -174,7 +167,7 @@ class Qasm3Validator:
         if not isinstance(base_size, int) or base_size <= 0:
             raise_qasm3_error(f"Invalid base size {base_size} for variable {var_name}", span=span)
 
-        if isinstance(base_type, FloatType) and base_size not in [32, 64]:
+        if isinstance(base_type, FloatType) and base_size not in {32, 64}:
             raise_qasm3_error(
                 f"Invalid base size {base_size} for float variable {var_name}", span=span
             )
@@ -279,9 +272,12 @@ class Qasm3Validator:
                     f" Expected {subroutine_def.return_type} but got void",
                     span=return_statement.span,
                 )
-            base_size = 1
-            if hasattr(subroutine_def.return_type, "size"):
-                base_size = subroutine_def.return_type.size.value
+            return_size = getattr(subroutine_def.return_type, "size", None)
+            if return_size is not None:
+                base_size = return_size.value
+            else:
+                # same defaults as a classical declaration without an explicit size
+                base_size = 1 if isinstance(subroutine_def.return_type, (BitType, BoolType)) else 32
 
             return Qasm3Validator.validate_variable_assignment_value(
                 Variable(
@@ -309,8 +305,5 @@ class Qasm3Validator:
         """
         if reg_name not in qubit_map:
             qubit_map[reg_name] = set(indices)
-        else:
-            for idx in indices:
-                if idx in qubit_map[reg_name]:
-                    return False
-        return True
+            return True
+        return qubit_map[reg_name].isdisjoint(indices)
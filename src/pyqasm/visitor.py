@@ -18,7 +18,8 @@ import copy
 import logging
 from collections import deque
 from functools import partial
-from typing import Any, Callable, Optional, Union
+from itertools import chain
+from typing import Any, Callable, Optional, Sequence, Union
 
 import numpy as np
 import openqasm3.ast as qasm3_ast
@@ -27,7 +28,11 @@ from pyqasm.analyzer import Qasm3Analyzer
 from pyqasm.elements import ClbitDepthNode, Context, InversionOp, QubitDepthNode, Variable
 from pyqasm.exceptions import ValidationError, raise_qasm3_error
 from pyqasm.expressions import Qasm3ExprEvaluator
-from pyqasm.maps import SWITCH_BLACKLIST_STMTS
+from pyqasm.maps import (
+    BRANCHING_COMPARISON_OPERATORS,
+    CONTROL_MODIFIERS,
+    SWITCH_BLACKLIST_STMTS,
+)
 from pyqasm.maps.expressions import ARRAY_TYPE_MAP, CONSTANTS_MAP, MAX_ARRAY_DIMENSIONS
 from pyqasm.maps.gates import map_qasm_inv_op_to_callable, map_qasm_op_to_callable
 from pyqasm.subroutines import Qasm3SubroutineProcessor
@@ -54,8 +59,8 @@ class QasmVisitor:
         self._scope: deque = deque([{}])
         self._context: deque = deque([Context.GLOBAL])
         self._included_files: set[str] = set()
-        self._qubit_labels: dict[str, int] = {}
-        self._clbit_labels: dict[str, int] = {}
+        self._qubit_labels: dict[tuple[str, int], int] = {}
+        self._clbit_labels: dict[tuple[str, int], int] = {}
         self._alias_qubit_labels: dict[tuple[str, int], tuple[str, int]] = {}
         self._global_qreg_size_map: dict[str, int] = {}
         self._global_alias_size_map: dict[str, int] = {}
@@ -63,11 +68,31 @@ class QasmVisitor:
         self._function_qreg_transform_map: deque = deque([])  # for nested functions
         self._global_creg_size_map: dict[str, int] = {}
         self._custom_gates: dict[str, qasm3_ast.QuantumGateDefinition] = {}
-        self._external_gates: list[str] = [] if external_gates is None else external_gates
+        self._external_gates: set[str] = set() if external_gates is None else set(external_gates)
         self._subroutine_defns: dict[str, qasm3_ast.SubroutineDefinition] = {}
         self._check_only: bool = check_only
         self._curr_scope: int = 0
         self._label_scope_level: dict[int, set] = {self._curr_scope: set()}
+        # built once per visitor, instead of once per visited statement
+        self._visit_map: dict[type, Callable] = {
+            qasm3_ast.Include: self._visit_include,  # No operation
+            qasm3_ast.QuantumMeasurementStatement: self._visit_measurement,
+            qasm3_ast.QuantumReset: self._visit_reset,
+            qasm3_ast.QuantumBarrier: self._visit_barrier,
+            qasm3_ast.QubitDeclaration: self._visit_quantum_register,
+            qasm3_ast.QuantumGateDefinition: self._visit_gate_definition,
+            qasm3_ast.QuantumGate: self._visit_generic_gate_operation,
+            qasm3_ast.QuantumPhase: self._visit_generic_gate_operation,
+            qasm3_ast.ClassicalDeclaration: self._visit_classical_declaration,
+            qasm3_ast.ClassicalAssignment: self._visit_classical_assignment,
+            qasm3_ast.ConstantDeclaration: self._visit_constant_declaration,
+            qasm3_ast.BranchingStatement: self._visit_branching_statement,
+            qasm3_ast.ForInLoop: self._visit_forin_loop,
+            qasm3_ast.AliasStatement: self._visit_alias_statement,
+            qasm3_ast.SwitchStatement: self._visit_switch_statement,
+            qasm3_ast.SubroutineDefinition: self._visit_subroutine_definition,
+            qasm3_ast.IODeclaration: lambda x: [],
+        }
 
         self._init_utilities()
 
@@ -141,22 +166,7 @@ class QasmVisitor:
           original value of the shadowed variable when we exit the block scope
 
         """
-        global_scope = self._get_global_scope()
-        curr_scope = self._get_curr_scope()
-        if self._in_global_scope():
-            return var_name in global_scope
-        if self._in_function_scope() or self._in_gate_scope():
-            if var_name in curr_scope:
-                return True
-            if var_name in global_scope:
-                return global_scope[var_name].is_constant
-        if self._in_block_scope():
-            for scope, context in zip(reversed(self._scope), reversed(self._context)):
-                if context != Context.BLOCK:
-                    return var_name in scope
-                if var_name in scope:
-                    return True
-        return False
+        return self._get_from_visible_scope(var_name) is not None
 
     def _get_from_visible_scope(self, var_name: str) -> Union[Variable, None]:
         """
@@ -174,17 +184,18 @@ class QasmVisitor:
         if self._in_global_scope():
             return global_scope.get(var_name, None)
         if self._in_function_scope() or self._in_gate_scope():
-            if var_name in curr_scope:
-                return curr_scope[var_name]
-            if var_name in global_scope and global_scope[var_name].is_constant:
-                return global_scope[var_name]
+            var = curr_scope.get(var_name, None)
+            if var is not None:
+                return var
+            var = global_scope.get(var_name, None)
+            if var is not None and var.is_constant:
+                return var
         if self._in_block_scope():
             for scope, context in zip(reversed(self._scope), reversed(self._context)):
-                if context != Context.BLOCK:
-                    return scope.get(var_name, None)
-                if var_name in scope:
-                    return scope[var_name]
-                    # keep on checking otherwise
+                var = scope.get(var_name, None)
+                if var is not None or context != Context.BLOCK:
+                    return var
+                # keep on checking otherwise
         return None
 
     def _add_var_in_scope(self, variable: Variable) -> None:
@@ -287,11 +298,11 @@ class QasmVisitor:
                 register_name, qasm3_ast.QubitDeclaration, register_size, None, None, False, True
             )
         )
-        size_map[f"{register_name}"] = register_size
+        size_map[register_name] = register_size
 
         for i in range(register_size):
             # required if indices are not used while applying a gate or measurement
-            label_map[f"{register_name}_{i}"] = current_size + i
+            label_map[(register_name, i)] = current_size + i
             self._module._qubit_depths[(register_name, i)] = QubitDepthNode(register_name, i)
 
         self._label_scope_level[self._curr_scope].add(register_name)
@@ -407,15 +418,14 @@ class QasmVisitor:
                 for bit_id in bit_ids
             ]
             # check for duplicate bits
-            for bit_id in new_bits:
-                bit_name, bit_value = bit_id.name.name, bit_id.indices[0][0].value
-                if tuple((bit_name, bit_value)) in visited_bits:
+            for bit_id in bit_ids:
+                if (reg_name, bit_id) in visited_bits:
                     raise_qasm3_error(
                         f"Duplicate {'qubit' if qubits else 'clbit'} "
-                        f"{bit_name}[{bit_value}] argument",
+                        f"{reg_name}[{bit_id}] argument",
                         span=operation.span,
                     )
-                visited_bits.add((bit_name, bit_value))
+                visited_bits.add((reg_name, bit_id))
 
             openqasm_bits.extend(new_bits)
 
@@ -442,22 +452,19 @@ class QasmVisitor:
         source_name: str = (
             source.name if isinstance(source, qasm3_ast.Identifier) else source.name.name
         )
-        if source_name not in self._global_qreg_size_map:
-            raise_qasm3_error(
-                f"Missing register declaration for {source_name} in measurement "
-                f"operation {statement}",
-                span=statement.span,
-            )
-
         target_name: str = (
             target.name if isinstance(target, qasm3_ast.Identifier) else target.name.name
         )
-        if target_name not in self._global_creg_size_map:
-            raise_qasm3_error(
-                f"Missing register declaration for {target_name} in measurement "
-                f"operation {statement}",
-                span=statement.span,
-            )
+        for reg_name, reg_size_map in (
+            (source_name, self._global_qreg_size_map),
+            (target_name, self._global_creg_size_map),
+        ):
+            if reg_name not in reg_size_map:
+                raise_qasm3_error(
+                    f"Missing register declaration for {reg_name} in measurement "
+                    f"operation {statement}",
+                    span=statement.span,
+                )
 
         source_ids = self._get_op_bits(
             statement, reg_size_map=self._global_qreg_size_map, qubits=True
@@ -473,6 +480,7 @@ class QasmVisitor:
                 span=statement.span,
             )
         unrolled_measurements = []
+        qubit_depths, clbit_depths = self._module._qubit_depths, self._module._clbit_depths
         for src_id, tgt_id in zip(source_ids, target_ids):
             unrolled_measure = qasm3_ast.QuantumMeasurementStatement(
                 measure=qasm3_ast.QuantumMeasurement(qubit=src_id), target=tgt_id
@@ -481,8 +489,8 @@ class QasmVisitor:
             tgt_name, tgt_id = tgt_id.name.name, tgt_id.indices[0][0].value  # type: ignore
 
             qubit_node, clbit_node = (
-                self._module._qubit_depths[(src_name, src_id)],
-                self._module._clbit_depths[(tgt_name, tgt_id)],
+                qubit_depths[(src_name, src_id)],
+                clbit_depths[(tgt_name, tgt_id)],
             )
             qubit_node.depth += 1
             qubit_node.num_measurements += 1
@@ -490,8 +498,7 @@ class QasmVisitor:
             clbit_node.depth += 1
             clbit_node.num_measurements += 1
 
-            qubit_node.depth = max(qubit_node.depth, clbit_node.depth)
-            clbit_node.depth = max(qubit_node.depth, clbit_node.depth)
+            qubit_node.depth = clbit_node.depth = max(qubit_node.depth, clbit_node.depth)
 
             unrolled_measurements.append(unrolled_measure)
 
@@ -522,11 +529,12 @@ class QasmVisitor:
         qubit_ids = self._get_op_bits(statement, self._global_qreg_size_map, True)
 
         unrolled_resets = []
+        qubit_depths = self._module._qubit_depths
         for qid in qubit_ids:
             unrolled_reset = qasm3_ast.QuantumReset(qubits=qid)
 
             qubit_name, qubit_id = qid.name.name, qid.indices[0][0].value  # type: ignore
-            qubit_node = self._module._qubit_depths[(qubit_name, qubit_id)]
+            qubit_node = qubit_depths[(qubit_name, qubit_id)]
 
             qubit_node.depth += 1
             qubit_node.num_resets += 1
@@ -562,21 +570,23 @@ class QasmVisitor:
             )
         barrier_qubits = self._get_op_bits(barrier, self._global_qreg_size_map)
         unrolled_barriers = []
+        qubit_nodes = []
         max_involved_depth = 0
+        qubit_depths = self._module._qubit_depths
         for qubit in barrier_qubits:
             unrolled_barrier = qasm3_ast.QuantumBarrier(qubits=[qubit])  # type: ignore[list-item]
             qubit_name, qubit_id = qubit.name.name, qubit.indices[0][0].value  # type: ignore
-            qubit_node = self._module._qubit_depths[(qubit_name, qubit_id)]
+            qubit_node = qubit_depths[(qubit_name, qubit_id)]
 
             qubit_node.depth += 1
             qubit_node.num_barriers += 1
 
             max_involved_depth = max(max_involved_depth, qubit_node.depth)
             unrolled_barriers.append(unrolled_barrier)
+            qubit_nodes.append(qubit_node)
 
-        for qubit in barrier_qubits:
-            qubit_name, qubit_id = qubit.name.name, qubit.indices[0][0].value  # type: ignore
-            qubit_node = self._module._qubit_depths[(qubit_name, qubit_id)]
+        # reuse the nodes found above instead of resolving each qubit again
+        for qubit_node in qubit_nodes:
             qubit_node.depth = max_involved_depth
 
         if self._check_only:
@@ -595,7 +605,10 @@ class QasmVisitor:
         """
         param_list = []
         for param in operation.arguments:
-            param_value = Qasm3ExprEvaluator.evaluate_expression(param)[0]
+            # common angle arguments like pi/2 need not go through the full evaluator
+            param_value = Qasm3ExprEvaluator.fold_constant_expression(param)
+            if param_value is None:
+                param_value = Qasm3ExprEvaluator.evaluate_expression(param)[0]
             param_list.append(param_value)
 
         return param_list
@@ -610,9 +623,9 @@ class QasmVisitor:
             None
         """
         gate_name = definition.name.name
-        if gate_name in self._custom_gates:
+        # registers the definition unless the name is already taken
+        if self._custom_gates.setdefault(gate_name, definition) is not definition:
             raise_qasm3_error(f"Duplicate gate definition for {gate_name}", span=definition.span)
-        self._custom_gates[gate_name] = definition
 
         return []
 
@@ -670,17 +683,18 @@ class QasmVisitor:
         Returns:
             None
         """
+        qubit_depths = self._module._qubit_depths
         for qubit_subset in all_targets:
             max_involved_depth = 0
+            qubit_nodes = []
             for qubit in qubit_subset:
                 qubit_name, qubit_id = qubit.name.name, qubit.indices[0][0].value  # type: ignore
-                qubit_node = self._module._qubit_depths[(qubit_name, qubit_id)]
+                qubit_node = qubit_depths[(qubit_name, qubit_id)]
                 qubit_node.num_gates += 1
                 max_involved_depth = max(max_involved_depth, qubit_node.depth + 1)
+                qubit_nodes.append(qubit_node)
 
-            for qubit in qubit_subset:
-                qubit_name, qubit_id = qubit.name.name, qubit.indices[0][0].value  # type: ignore
-                qubit_node = self._module._qubit_depths[(qubit_name, qubit_id)]
+            for qubit_node in qubit_nodes:
                 qubit_node.depth = max_involved_depth
 
     def _visit_basic_gate_operation(  # pylint: disable=too-many-locals
@@ -838,16 +852,16 @@ class QasmVisitor:
         logger.debug("Visiting external gate operation '%s'", str(operation))
         gate_name: str = operation.name.name
 
-        if gate_name in self._custom_gates:
+        gate_definition = self._custom_gates.get(gate_name)
+        if gate_definition is not None:
             # Ignore result, this is just for validation
             self._visit_custom_gate_operation(operation, inverse=inverse)
-            # Don't need to check if custom gate exists, since we just validated the call
-            gate_qubit_count = len(self._custom_gates[gate_name].qubits)
+            gate_qubit_count = len(gate_definition.qubits)
         else:
             # Ignore result, this is just for validation
             self._visit_basic_gate_operation(operation, inverse=inverse)
             # Don't need to check if basic gate exists, since we just validated the call
-            _, gate_qubit_count = map_qasm_op_to_callable(operation.name.name)
+            _, gate_qubit_count = map_qasm_op_to_callable(gate_name)
 
         op_parameters = [
             qasm3_ast.FloatLiteral(param) for param in self._get_op_parameters(operation)
@@ -892,13 +906,20 @@ class QasmVisitor:
         """
         logger.debug("Visiting phase operation '%s'", str(operation))
 
-        evaluated_arg = Qasm3ExprEvaluator.evaluate_expression(operation.argument)[0]
+        # gphase angles are mostly literals or multiples of pi, fold them directly
+        evaluated_arg = Qasm3ExprEvaluator.fold_constant_expression(operation.argument)
+        if evaluated_arg is None:
+            evaluated_arg = Qasm3ExprEvaluator.evaluate_expression(operation.argument)[0]
         if inverse:
             evaluated_arg = -1 * evaluated_arg
         # remove the modifiers, as we have already applied the inverse
         operation.modifiers = []
 
-        operation.argument = qasm3_ast.FloatLiteral(value=evaluated_arg)
+        if isinstance(operation.argument, qasm3_ast.FloatLiteral):
+            # operation is already a copy of the original statement
+            operation.argument.value = evaluated_arg
+        else:
+            operation.argument = qasm3_ast.FloatLiteral(value=evaluated_arg)
         # no qubit evaluation to be done here
         # if args are provided in global scope, then we should raise error
         if self._in_global_scope() and len(operation.qubits) != 0:
@@ -939,10 +960,7 @@ class QasmVisitor:
                 power_value = power_value * abs(current_power)
             elif modifier_name == qasm3_ast.GateModifierName.inv:
                 inverse_value = not inverse_value
-            elif modifier_name in [
-                qasm3_ast.GateModifierName.ctrl,
-                qasm3_ast.GateModifierName.negctrl,
-            ]:
+            elif modifier_name in CONTROL_MODIFIERS:
                 raise_qasm3_error(
                     f"Controlled modifier gates not yet supported in gate operation {operation}",
                     err_type=NotImplementedError,
@@ -981,16 +999,22 @@ class QasmVisitor:
             )
         # Applying the inverse first and then the power is same as
         # apply the power first and then inverting the result
+        # the kind of gate does not change across the power, so resolve it only once
+        visit_function: Callable[
+            [bool], Sequence[Union[qasm3_ast.QuantumGate, qasm3_ast.QuantumPhase]]
+        ]
+        if isinstance(operation, qasm3_ast.QuantumPhase):
+            visit_function = partial(self._visit_phase_operation, operation)
+        elif operation.name.name in self._external_gates:
+            visit_function = partial(self._visit_external_gate_operation, operation)
+        elif operation.name.name in self._custom_gates:
+            visit_function = partial(self._visit_custom_gate_operation, operation)
+        else:
+            visit_function = partial(self._visit_basic_gate_operation, operation)
+
         result: list[Union[qasm3_ast.QuantumGate, qasm3_ast.QuantumPhase]] = []
         for _ in range(power_value):
-            if isinstance(operation, qasm3_ast.QuantumPhase):
-                result.extend(self._visit_phase_operation(operation, inverse_value))
-            elif operation.name.name in self._external_gates:
-                result.extend(self._visit_external_gate_operation(operation, inverse_value))
-            elif operation.name.name in self._custom_gates:
-                result.extend(self._visit_custom_gate_operation(operation, inverse_value))
-            else:
-                result.extend(self._visit_basic_gate_operation(operation, inverse_value))
+            result.extend(visit_function(inverse_value))
 
         if self._check_only:
             return []
@@ -1025,20 +1049,18 @@ class QasmVisitor:
         statements.extend(stmts)
 
         base_type = statement.type
+        size_expr = getattr(base_type, "size", None)
         if isinstance(base_type, qasm3_ast.BoolType):
             base_size = 1
-        elif hasattr(base_type, "size"):
-            if base_type.size is None:
-                base_size = 32  # default for now
-            else:
-                base_size = Qasm3ExprEvaluator.evaluate_expression(base_type.size, const_expr=True)[
-                    0
-                ]
-                if not isinstance(base_size, int) or base_size <= 0:
-                    raise_qasm3_error(
-                        f"Invalid base size {base_size} for variable {var_name}",
-                        span=statement.span,
-                    )
+        elif size_expr is None:
+            base_size = 32  # default for now
+        else:
+            base_size = Qasm3ExprEvaluator.evaluate_expression(size_expr, const_expr=True)[0]
+            if not isinstance(base_size, int) or base_size <= 0:
+                raise_qasm3_error(
+                    f"Invalid base size {base_size} for variable {var_name}",
+                    span=statement.span,
+                )
 
         variable = Variable(var_name, base_type, base_size, [], init_value, is_constant=True)
 
@@ -1088,25 +1110,27 @@ class QasmVisitor:
         if isinstance(base_type, qasm3_ast.ArrayType):
             dimensions = base_type.dimensions
             base_type = base_type.base_type
+        is_bit_type = isinstance(base_type, qasm3_ast.BitType)
 
         base_size = 1
         if not isinstance(base_type, qasm3_ast.BoolType):
-            initial_size = 1 if isinstance(base_type, qasm3_ast.BitType) else 32
+            initial_size = 1 if is_bit_type else 32
+            size_expr = getattr(base_type, "size", None)
             base_size = (
                 initial_size
-                if not hasattr(base_type, "size") or base_type.size is None
-                else Qasm3ExprEvaluator.evaluate_expression(base_type.size, const_expr=True)[0]
+                if size_expr is None
+                else Qasm3ExprEvaluator.evaluate_expression(size_expr, const_expr=True)[0]
             )
         Qasm3Validator.validate_classical_type(base_type, base_size, var_name, statement.span)
 
         # initialize the bit register
-        if isinstance(base_type, qasm3_ast.BitType):
+        if is_bit_type:
             final_dimensions = [base_size]
             init_value = np.full(final_dimensions, 0)
 
         if len(dimensions) > 0:
             # bit type arrays are not allowed
-            if isinstance(base_type, qasm3_ast.BitType):
+            if is_bit_type:
                 raise_qasm3_error(
                     f"Can not declare array {var_name} with type 'bit'", span=statement.span
                 )
@@ -1151,7 +1175,7 @@ class QasmVisitor:
             base_size,
             final_dimensions,
             init_value,
-            is_register=isinstance(base_type, qasm3_ast.BitType),
+            is_register=is_bit_type,
         )
 
         # validate the assignment
@@ -1165,21 +1189,18 @@ class QasmVisitor:
                 )
         self._add_var_in_scope(variable)
 
-        if isinstance(base_type, qasm3_ast.BitType):
+        if is_bit_type:
             self._global_creg_size_map[var_name] = base_size
             current_classical_size = len(self._clbit_labels)
             for i in range(base_size):
-                self._clbit_labels[f"{var_name}_{i}"] = current_classical_size + i
+                self._clbit_labels[(var_name, i)] = current_classical_size + i
                 self._module._clbit_depths[(var_name, i)] = ClbitDepthNode(var_name, i)
 
             self._label_scope_level[self._curr_scope].add(var_name)
 
-            if hasattr(statement.type, "size"):
-                statement.type.size = (
-                    qasm3_ast.IntegerLiteral(1)
-                    if statement.type.size is None
-                    else qasm3_ast.IntegerLiteral(base_size)
-                )
+            # bit registers can not be arrays, so base_type is the declared type and
+            # an unsized declaration already resolved to a base_size of 1
+            base_type.size = qasm3_ast.IntegerLiteral(base_size)  # type: ignore[attr-defined]
             statements.append(statement)
             self._module._add_classical_register(var_name, base_size)
 
@@ -1369,9 +1390,7 @@ class QasmVisitor:
                 result.append(new_if_block)
             else:
                 # unroll multi-bit branch
-                assert isinstance(rhs_value, int) and op in [
-                    qasm3_ast.BinaryOperator[o] for o in ["==", ">=", "<=", ">", "<"]
-                ]
+                assert isinstance(rhs_value, int) and op in BRANCHING_COMPARISON_OPERATORS
 
                 if op == qasm3_ast.BinaryOperator[">"]:
                     op = qasm3_ast.BinaryOperator[">="]
@@ -1533,10 +1552,12 @@ class QasmVisitor:
 
         """
         fn_name = statement.name.name
-        if fn_name not in self._subroutine_defns:
-            raise_qasm3_error(f"Undefined subroutine '{fn_name}' was called", span=statement.span)
-
-        subroutine_def = self._subroutine_defns[fn_name]
+        try:
+            subroutine_def = self._subroutine_defns[fn_name]
+        except KeyError as err:
+            raise_qasm3_error(
+                f"Undefined subroutine '{fn_name}' was called", span=statement.span, raised_from=err
+            )
 
         if len(statement.arguments) != len(subroutine_def.arguments):
             raise_qasm3_error(
@@ -1652,59 +1673,56 @@ class QasmVisitor:
             raise_qasm3_error(f"Re-declaration of variable '{alias_reg_name}'", span=statement.span)
         self._label_scope_level[self._curr_scope].add(alias_reg_name)
 
+        alias_index: Optional[Union[qasm3_ast.DiscreteSet, list]] = None
         if isinstance(value, qasm3_ast.Identifier):
             aliased_reg_name = value.name
         elif isinstance(value, qasm3_ast.IndexExpression) and isinstance(
             value.collection, qasm3_ast.Identifier
         ):
             aliased_reg_name = value.collection.name
+            alias_index = value.index
         else:
             raise_qasm3_error(f"Unsupported aliasing {statement}", span=statement.span)
 
-        if aliased_reg_name not in self._global_qreg_size_map:
+        try:
+            aliased_reg_size = self._global_qreg_size_map[aliased_reg_name]
+        except KeyError as err:
             raise_qasm3_error(
-                f"Qubit register {aliased_reg_name} not found for aliasing", span=statement.span
+                f"Qubit register {aliased_reg_name} not found for aliasing",
+                span=statement.span,
+                raised_from=err,
             )
-        aliased_reg_size = self._global_qreg_size_map[aliased_reg_name]
-        if isinstance(value, qasm3_ast.Identifier):  # "let alias = q;"
+        if alias_index is None:  # "let alias = q;"
             for i in range(aliased_reg_size):
                 self._alias_qubit_labels[(alias_reg_name, i)] = (aliased_reg_name, i)
             alias_reg_size = aliased_reg_size
-        elif isinstance(value, qasm3_ast.IndexExpression):
-            if isinstance(value.index, qasm3_ast.DiscreteSet):  # "let alias = q[{0,1}];"
-                qids = Qasm3Transformer.extract_values_from_discrete_set(value.index)
-                for i, qid in enumerate(qids):
-                    Qasm3Validator.validate_register_index(
-                        qid, self._global_qreg_size_map[aliased_reg_name], qubit=True
-                    )
-                    self._alias_qubit_labels[(alias_reg_name, i)] = (aliased_reg_name, qid)
-                alias_reg_size = len(qids)
-            elif len(value.index) != 1:  # like "let alias = q[0,1];"?
-                raise_qasm3_error(
-                    "An index set can be specified by a single integer (signed or unsigned), "
-                    "a comma-separated list of integers contained in braces {a,b,c,…}, "
-                    "or a range",
-                    span=statement.span,
-                )
-            elif isinstance(value.index[0], qasm3_ast.IntegerLiteral):  # "let alias = q[0];"
-                qid = value.index[0].value
-                Qasm3Validator.validate_register_index(
-                    qid, self._global_qreg_size_map[aliased_reg_name], qubit=True
-                )
-                self._alias_qubit_labels[(alias_reg_name, 0)] = (
-                    aliased_reg_name,
-                    value.index[0].value,
-                )
-                alias_reg_size = 1
-            elif isinstance(value.index[0], qasm3_ast.RangeDefinition):  # "let alias = q[0:1:2];"
-                qids = Qasm3Transformer.get_qubits_from_range_definition(
-                    value.index[0],
-                    aliased_reg_size,
-                    is_qubit_reg=True,
-                )
-                for i, qid in enumerate(qids):
-                    self._alias_qubit_labels[(alias_reg_name, i)] = (aliased_reg_name, qid)
-                alias_reg_size = len(qids)
+        elif isinstance(alias_index, qasm3_ast.DiscreteSet):  # "let alias = q[{0,1}];"
+            qids = Qasm3Transformer.extract_values_from_discrete_set(alias_index)
+            for i, qid in enumerate(qids):
+                Qasm3Validator.validate_register_index(qid, aliased_reg_size, qubit=True)
+                self._alias_qubit_labels[(alias_reg_name, i)] = (aliased_reg_name, qid)
+            alias_reg_size = len(qids)
+        elif len(alias_index) != 1:  # like "let alias = q[0,1];"?
+            raise_qasm3_error(
+                "An index set can be specified by a single integer (signed or unsigned), "
+                "a comma-separated list of integers contained in braces {a,b,c,…}, "
+                "or a range",
+                span=statement.span,
+            )
+        elif isinstance(alias_index[0], qasm3_ast.IntegerLiteral):  # "let alias = q[0];"
+            qid = alias_index[0].value
+            Qasm3Validator.validate_register_index(qid, aliased_reg_size, qubit=True)
+            self._alias_qubit_labels[(alias_reg_name, 0)] = (aliased_reg_name, qid)
+            alias_reg_size = 1
+        elif isinstance(alias_index[0], qasm3_ast.RangeDefinition):  # "let alias = q[0:1:2];"
+            qids = Qasm3Transformer.get_qubits_from_range_definition(
+                alias_index[0],
+                aliased_reg_size,
+                is_qubit_reg=True,
+            )
+            for i, qid in enumerate(qids):
+                self._alias_qubit_labels[(alias_reg_name, i)] = (aliased_reg_name, qid)
+            alias_reg_size = len(qids)
 
         self._global_alias_size_map[alias_reg_name] = alias_reg_size
 
@@ -1823,36 +1841,14 @@ class QasmVisitor:
         """
         logger.debug("Visiting statement '%s'", str(statement))
         result = []
-        visit_map = {
-            qasm3_ast.Include: self._visit_include,  # No operation
-            qasm3_ast.QuantumMeasurementStatement: self._visit_measurement,
-            qasm3_ast.QuantumReset: self._visit_reset,
-            qasm3_ast.QuantumBarrier: self._visit_barrier,
-            qasm3_ast.QubitDeclaration: self._visit_quantum_register,
-            qasm3_ast.QuantumGateDefinition: self._visit_gate_definition,
-            qasm3_ast.QuantumGate: self._visit_generic_gate_operation,
-            qasm3_ast.QuantumPhase: self._visit_generic_gate_operation,
-            qasm3_ast.ClassicalDeclaration: self._visit_classical_declaration,
-            qasm3_ast.ClassicalAssignment: self._visit_classical_assignment,
-            qasm3_ast.ConstantDeclaration: self._visit_constant_declaration,
-            qasm3_ast.BranchingStatement: self._visit_branching_statement,
-            qasm3_ast.ForInLoop: self._visit_forin_loop,
-            qasm3_ast.AliasStatement: self._visit_alias_statement,
-            qasm3_ast.SwitchStatement: self._visit_switch_statement,
-            qasm3_ast.SubroutineDefinition: self._visit_subroutine_definition,
-            qasm3_ast.ExpressionStatement: lambda x: self._visit_function_call(x.expression),
-            qasm3_ast.IODeclaration: lambda x: [],
-        }
-
-        visitor_function = visit_map.get(type(statement))
+        visitor_function = self._visit_map.get(type(statement))
 
         if visitor_function:
-            if isinstance(statement, qasm3_ast.ExpressionStatement):
-                # these return a tuple of return value and list of statements
-                _, ret_stmts = visitor_function(statement)  # type: ignore[operator]
-                result.extend(ret_stmts)
-            else:
-                result.extend(visitor_function(statement))  # type: ignore[operator]
+            result.extend(visitor_function(statement))  # type: ignore[operator]
+        elif isinstance(statement, qasm3_ast.ExpressionStatement):
+            # these return a tuple of return value and list of statements
+            _, ret_stmts = self._visit_function_call(statement.expression)  # type: ignore[arg-type]
+            result.extend(ret_stmts)
         else:
             raise_qasm3_error(
                 f"Unsupported statement of type {type(statement)}", span=statement.span
@@ -1868,10 +1864,7 @@ class QasmVisitor:
         Returns:
             list[qasm3_ast.Statement]: The list of unrolled statements.
         """
-        result = []
-        for stmt in stmt_list:
-            result.extend(self.visit_statement(stmt))
-        return result
+        return list(chain.from_iterable(self.visit_statement(stmt) for stmt in stmt_list))
 
     def finalize(self, unrolled_stmts):
         """Finalize the unrolled statements.
@@ -1887,9 +1880,10 @@ class QasmVisitor:
 
         """
         # remove the gphase qubits if they use ALL qubits
+        total_qubits = len(self._qubit_labels)
         for stmt in unrolled_stmts:
             # Rule 1
             if isinstance(stmt, qasm3_ast.QuantumPhase):
-                if len(stmt.qubits) == len(self._qubit_labels):
+                if len(stmt.qubits) == total_qubits:
                     stmt.qubits = []
         return unrolled_stmts
@@ -111,6 +111,20 @@ SUBROUTINE_INCORRECT_TESTS = {
         """,
         "Return type mismatch for subroutine 'my_function'.",
     ),
+    "unsized_return_out_of_range": (
+        """
+        OPENQASM 3;
+        include "stdgates.inc";
+
+        def my_function(qubit q) -> int {
+            h q;
+            return 2147483648;
+        }
+        qubit q;
+        my_function(q);
+        """,
+        "Value 2147483648 out of limits for variable my_function_return with base size 32",
+    ),
     "subroutine_keyword_naming": (
         """
         OPENQASM 3;
@@ -211,6 +211,28 @@ def test_function_call_with_return():
     check_single_qubit_gate_op(result.unrolled_ast, 1, [0], "h")
 
 
+def test_function_call_with_unsized_return_type():
+    """Test that a return type without an explicit size uses the default size."""
+    qasm_str = """OPENQASM 3.0;
+    include "stdgates.inc";
+
+    def my_function(qubit q) -> int {
+        h q;
+        return 1024;
+    }
+    qubit q;
+    int r = my_function(q);
+    rx(r) q;
+    """
+
+    result = loads(qasm_str)
+    result.unroll()
+    assert result.num_qubits == 1
+
+    check_single_qubit_gate_op(result.unrolled_ast, 1, [0], "h")
+    check_single_qubit_rotation_op(result.unrolled_ast, 1, [0], [1024], "rx")
+
+
 def test_return_values_from_function():
     """Test that the values returned from a function are used correctly in other function."""
     qasm_str = """OPENQASM 3.0;
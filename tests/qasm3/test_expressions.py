@@ -12,10 +12,13 @@
 Module containing unit tests for expressions.
 
 """
+import openqasm3.ast as qasm3_ast
 import pytest
 
 from pyqasm.entrypoint import loads
 from pyqasm.exceptions import ValidationError
+from pyqasm.expressions import Qasm3ExprEvaluator
+from pyqasm.maps.expressions import CONSTANTS_MAP
 from tests.utils import check_measure_op, check_single_qubit_gate_op, check_single_qubit_rotation_op
 
 
@@ -85,3 +88,53 @@ def test_incorrect_expressions():
 
     with pytest.raises(ValidationError, match="Uninitialized variable x in expression"):
         loads("OPENQASM 3; qubit q; int x; rx(x) q;").validate()
+
+
+def test_constant_folded_gate_parameters():
+    qasm_str = """OPENQASM 3;
+    qubit q;
+    rx(-pi/2) q;
+    rx(2*pi - 1) q;
+    rx(-(tau/4)) q;
+    """
+
+    result = loads(qasm_str)
+    result.unroll()
+    rx_expression_values = [
+        -CONSTANTS_MAP["pi"] / 2,
+        2 * CONSTANTS_MAP["pi"] - 1,
+        -CONSTANTS_MAP["tau"] / 4,
+    ]
+    check_single_qubit_rotation_op(result.unrolled_ast, 3, [0] * 3, rx_expression_values, "rx")
+
+
+def test_fold_constant_expression():
+    """Test that literal and constant trees are folded and anything else is left alone."""
+    neg_pi = qasm3_ast.UnaryExpression(qasm3_ast.UnaryOperator["-"], qasm3_ast.Identifier("pi"))
+    neg_pi_by_2 = qasm3_ast.BinaryExpression(
+        qasm3_ast.BinaryOperator["/"], neg_pi, qasm3_ast.IntegerLiteral(2)
+    )
+    assert Qasm3ExprEvaluator.fold_constant_expression(neg_pi_by_2) == -CONSTANTS_MAP["pi"] / 2
+
+    scaled = qasm3_ast.BinaryExpression(
+        qasm3_ast.BinaryOperator["*"], qasm3_ast.FloatLiteral(1.5), qasm3_ast.IntegerLiteral(4)
+    )
+    assert Qasm3ExprEvaluator.fold_constant_expression(scaled) == 6.0
+
+    # identifiers that are not built-in constants have to go through the evaluator
+    variable = qasm3_ast.Identifier("a")
+    assert Qasm3ExprEvaluator.fold_constant_expression(variable) is None
+    assert (
+        Qasm3ExprEvaluator.fold_constant_expression(
+            qasm3_ast.UnaryExpression(qasm3_ast.UnaryOperator["-"], variable)
+        )
+        is None
+    )
+    assert (
+        Qasm3ExprEvaluator.fold_constant_expression(
+            qasm3_ast.BinaryExpression(
+                qasm3_ast.BinaryOperator["*"], qasm3_ast.IntegerLiteral(2), variable
+            )
+        )
+        is None
+    )